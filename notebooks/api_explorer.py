@@ -7,17 +7,173 @@ Script para explorar e entender a estrutura da API Scryfall
 Autor: Leonardo - Engenheiro de Dados
 """
 
-import requests
+import asyncio
+import contextlib
+import hashlib
+import httpx
 import json
+import ijson
+import orjson
+import os
+import random
+import re
+import sys
 import time
+from collections import deque
 from pathlib import Path
 from loguru import logger
 from typing import Dict, Any, List, Optional
 
 # Configuração de logging
+# Os logs DEBUG por requisição usam argumentos em vez de f-strings: quando
+# nenhum sink aceita DEBUG, são descartados antes de formatar a mensagem
+
+# Diretório de logs criado uma única vez, na importação
+Path("logs").mkdir(exist_ok=True)
+# enqueue=True tira a escrita em disco do caminho das requisições (thread própria)
 logger.add("logs/api_exploration.log",
            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {function} | {message}", 
-           level="INFO")
+           level="INFO",
+           enqueue=True,
+           backtrace=False,
+           diagnose=False)
+
+# Eventos ijson que carregam valores escalares
+_SCALAR_EVENTS = {"null", "boolean", "integer", "double", "number", "string"}
+
+# Separador entre tipos e subtipos da type_line ("Creature — Human Wizard");
+# a Scryfall usa travessão (U+2014), mas o hífen ASCII também é aceito
+_TYPE_SEP = re.compile(r"\s*[—-]\s*")
+
+# Campos extraídos de cada carta para a amostra, na ordem do relatório
+_CARD_FIELDS = ("name", "mana_cost", "type_line", "rarity", "colors", "set", "lang")
+# Padrões diferentes de None, como código-fonte (avaliado a cada chamada)
+_CARD_DEFAULTS = {"colors": "[]"}
+
+def _build_card_extractor():
+    """
+    Gera uma função especializada que monta o dict de amostra de uma carta
+
+    Como os campos são fixos, o dict literal é compilado uma única vez em
+    vez de ser montado campo a campo a cada carta
+    """
+    items = ", ".join(
+        f"{field!r}: c.get({field!r}, {_CARD_DEFAULTS.get(field, 'None')})"
+        for field in _CARD_FIELDS
+    )
+    return eval(compile(f"lambda c: {{{items}}}", "<card_extractor>", "eval"))
+
+_extract_card = _build_card_extractor()
+
+class _SlidingWindowLimiter:
+    """
+    Limita requisições a `max_requests` por janela de `window` segundos
+
+    Guarda o horário das últimas requisições admitidas e só pede espera
+    quando a janela está cheia, sem pausa fixa entre chamadas
+    """
+
+    def __init__(self, max_requests: int = 10, window: float = 1.0):
+        self.window = window
+        self._times: deque = deque(maxlen=max_requests)
+
+    def reserve(self) -> float:
+        """
+        Reserva um horário para a próxima requisição
+
+        Returns:
+            Segundos a esperar antes de enviar (0.0 se houver folga)
+        """
+        now = time.monotonic()
+        delay = 0.0
+        if len(self._times) == self._times.maxlen:
+            delay = max(0.0, self.window - (now - self._times[0]))
+        # Reserva já no horário de envio para que chamadas concorrentes
+        # enxerguem a janela ocupada
+        self._times.append(now + delay)
+        return delay
+
+def _retry_delay(response: httpx.Response, attempt: int, base: float = 0.5) -> float:
+    """
+    Calcula a espera antes de repetir uma requisição que recebeu HTTP 429
+
+    Respeita o header Retry-After quando presente e aplica backoff
+    exponencial com jitter
+    """
+    backoff = base * 2 ** attempt
+    try:
+        backoff = max(backoff, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        pass
+    return backoff + random.uniform(0, base)
+
+class _PageCollector:
+    """
+    Monta uma página de lista da API a partir de eventos ijson, parando
+    assim que os primeiros `limit` itens de `data` forem construídos
+
+    Os campos escalares do topo (total_cards, has_more, ...) chegam antes
+    de `data` nas respostas da Scryfall, então são lidos na mesma passada
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.header: Dict[str, Any] = {}
+        self.items: List[Dict[str, Any]] = []
+        self._builder = None
+        # Interface push do ijson: aceita blocos de bytes de qualquer origem
+        self._events = ijson.sendable_list()
+        self._coro = ijson.parse_coro(self._events, use_float=True)
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        """
+        Consome um bloco do corpo da resposta
+
+        Returns:
+            True quando `limit` itens já foram coletados
+        """
+        self._coro.send(chunk)
+        return self._drain()
+
+    def close(self):
+        """Finaliza o parser, validando que o JSON terminou corretamente"""
+        self._coro.close()
+        self._drain()
+
+    def _drain(self) -> bool:
+        try:
+            for prefix, event, value in self._events:
+                if self.feed(prefix, event, value):
+                    return True
+            return False
+        finally:
+            del self._events[:]
+
+    def feed(self, prefix: str, event: str, value: Any) -> bool:
+        """
+        Consome um evento do parser
+
+        Returns:
+            True quando `limit` itens já foram coletados
+        """
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if prefix == "data.item" and event == "end_map":
+                self.items.append(self._builder.value)
+                self._builder = None
+                return len(self.items) >= self.limit
+        elif prefix == "data.item" and event == "start_map":
+            # Com limit <= 0 nenhum item é coletado (equivale ao slice [:0])
+            if self.limit <= 0:
+                return True
+            self._builder = ijson.ObjectBuilder()
+            self._builder.event(event, value)
+        elif prefix == "" and event == "map_key":
+            # Preserva a ordem das chaves do topo para structure_keys
+            self.header.setdefault(value, None)
+        elif prefix in self.header and event in _SCALAR_EVENTS:
+            self.header[prefix] = value
+        return False
 
 class ScryfallExplorer:
     """
@@ -32,26 +188,215 @@ class ScryfallExplorer:
 
     def __init__(self):
         self.base_url = "https://api.scryfall.com"
-        self.session = requests.Session()
 
         # Headers recomendados para boa prática
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'KyberCorax-DataPipeline/1.0 (Educational Purpose)', 
-            'Accept': 'application/json'
-        })
+            'Accept': 'application/json',
+            # Brotli comprime bem mais o /sets; o httpx descomprime (pacote brotli)
+            'Accept-Encoding': 'br, gzip'
+        }
+
+        # Cliente síncrono criado só no primeiro uso (ver a propriedade session):
+        # a execução assíncrona do main() nunca precisa dele
+        self._session: Optional[httpx.Client] = None
+
+        # Diretórios de saída criados uma única vez, fora do caminho de gravação
+        self._out_dir = Path("data/exploration")
+        self._out_dir.mkdir(parents=True, exist_ok=True)
+
+        # Cache em disco para GET condicional (ETag/Last-Modified)
+        self.cache_dir = Path("data/bronze/http_cache")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Rate limiting - Scryfall recomenda máximo 10 requests por segundo
-        self.request_delay = 0.1 # 100ms entre requests
+        # Janela compartilhada pelas versões síncrona e assíncrona
+        self.max_retries = 3
+        self._limiter = _SlidingWindowLimiter(max_requests=10, window=1.0)
+
+        # Versão assíncrona: até 10 requisições em voo dentro da janela de 1s
+        # (o semáforo é criado a cada execução, preso ao event loop dela)
+        self.max_concurrency = 10
 
         logger.info("ScryfallExplorer inicializado")
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    @property
+    def session(self) -> httpx.Client:
+        """Cliente HTTP síncrono, criado na primeira requisição síncrona"""
+        if self._session is None:
+            # HTTP/2 multiplexa as requisições numa única conexão TCP/TLS
+            self._session = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=4)
+            )
+        return self._session
+
+    def close(self):
+        """Fecha o cliente síncrono, se ele chegou a ser criado"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _cache_paths(self, endpoint: str, params: Optional[Dict] = None):
+        """
+        Caminhos do corpo e dos metadados em cache de uma requisição
+
+        Os parâmetros da query entram no nome do arquivo, para que consultas
+        diferentes ao mesmo endpoint não compartilhem a resposta
+        """
+        name = endpoint.strip("/").replace("/", "_")
+        if params:
+            digest = hashlib.sha1(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()[:12]
+            name = f"{name}_{digest}"
+        return self.cache_dir / f"{name}.json", self.cache_dir / f"{name}.meta.json"
+
+    def _conditional_headers(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, str]:
+        """
+        Monta os headers If-None-Match / If-Modified-Since a partir do cache
+
+        Returns:
+            Dicionário vazio quando não há resposta em cache
+        """
+        body_path, meta_path = self._cache_paths(endpoint, params)
+        if not (body_path.exists() and meta_path.exists()):
+            return {}
+
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _store_cache(self, endpoint: str, params: Optional[Dict], response: httpx.Response):
+        """Guarda o corpo cru e os validadores da resposta para revalidação futura"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+
+        body_path, meta_path = self._cache_paths(endpoint, params)
+        body_tmp = body_path.with_name(body_path.name + ".tmp")
+        meta_tmp = meta_path.with_name(meta_path.name + ".tmp")
+        try:
+            body_tmp.write_bytes(response.content)
+            meta_tmp.write_bytes(orjson.dumps({"etag": etag, "last_modified": last_modified}))
+            # Metadados saem antes e entram por último: uma interrupção no meio
+            # deixa o corpo sem validadores, nunca validadores de outro corpo
+            meta_path.unlink(missing_ok=True)
+            os.replace(body_tmp, body_path)
+            os.replace(meta_tmp, meta_path)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar cache de {endpoint}: {e}")
+
+    def _invalidate_cache(self, endpoint: str, params: Optional[Dict] = None):
+        """Remove corpo e metadados em cache (ex.: corpo corrompido)"""
+        for path in self._cache_paths(endpoint, params):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Não foi possível remover cache {path}: {e}")
+
+    def _response_body(self, endpoint: str, params: Optional[Dict], response: httpx.Response,
+                       cache: bool) -> bytes:
+        """
+        Extrai o corpo da resposta, usando o cache quando o servidor responde 304
+
+        Raises:
+            httpx.HTTPStatusError: Para status HTTP de erro
+            OSError: Se o corpo em cache não puder ser lido
+        """
+        if cache and response.status_code == 304:
+            logger.debug("Resposta de {} não modificada - usando cache", endpoint)
+            return self._cache_paths(endpoint, params)[0].read_bytes()
+
+        response.raise_for_status() # Raise exception para status HTTPS de erro
+        if cache:
+            self._store_cache(endpoint, params, response)
+        return response.content
+
+    def _get(self, url: str, params: Optional[Dict] = None, stream: bool = False,
+             headers: Optional[Dict] = None) -> httpx.Response:
+        """
+        Envia um GET respeitando o rate limit e repetindo em caso de HTTP 429
+
+        Args:
+            url: URL completa
+            params: Parâmetros da query string
+            stream: Se True, o corpo não é lido (o chamador deve fechar a resposta)
+            headers: Headers extras da requisição
+
+        Returns:
+            Resposta final (pode ter status de erro)
+        """
+        for attempt in range(self.max_retries + 1):
+            # Só espera quando as últimas 10 requisições couberam em menos de 1s
+            delay = self._limiter.reserve()
+            if delay:
+                time.sleep(delay)
+
+            request = self.session.build_request("GET", url, params=params, headers=headers)
+            response = self.session.send(request, stream=stream)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+
+            response.close()
+            delay = _retry_delay(response, attempt)
+            logger.warning(f"HTTP 429 em {url}, nova tentativa em {delay:.2f}s")
+            time.sleep(delay)
+
+    def _decode_body(self, url: str, endpoint: str, params: Optional[Dict], response: httpx.Response,
+                     cache: bool) -> Optional[Dict]:
+        """
+        Valida e decodifica uma resposta já recebida (parte comum das versões
+        síncrona e assíncrona do _make_request)
+
+        Args:
+            url: URL completa (para os logs)
+            endpoint: Endpoint da API
+            params: Parâmetros da query string
+            response: Resposta com o corpo já lido
+            cache: Se True, usa e atualiza o cache do GET condicional
+
+        Returns:
+            Dicionário com resposta JSON ou None em caso de erro
+        """
+        try:
+            body = self._response_body(endpoint, params, response, cache)
+
+            logger.debug("Requisição bem-sucessida - Status: {}", response.status_code)
+            # orjson lê os bytes crus, sem o decode UTF-8 do response.json()
+            return orjson.loads(body)
+
+        except httpx.HTTPError as e:
+            logger.error(f"Erro na requisição para {url}: {e}")
+            return None
+        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
+            logger.error(f"Erro ao decodificar JSON de {url}: {e}")
+            if cache:
+                # Sem isso, o ETag guardado faria toda execução receber 304 e
+                # reler o mesmo corpo inválido
+                self._invalidate_cache(endpoint, params)
+            return None
+        except OSError as e:
+            logger.error(f"Erro ao ler cache de {url}: {e}")
+            return None
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None, cache: bool = False) -> Optional[Dict]:
         """
         Método privado para fazer requisições com tratamento de erro
 
         Args:
             endpoint: Endpoint da API
             params: Parâmetros da query string
+            cache: Se True, revalida a resposta em cache com GET condicional
 
         Returns: 
             Dicionário com resposta JSN ou None em caso de erro
@@ -59,23 +404,170 @@ class ScryfallExplorer:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            logger.info(f"Fazendo requisição para: {url}")
+            logger.debug("Fazendo requisição para: {}", url)
             if params:
-                logger.info(f"Parâmetros: {params}")
+                logger.debug("Parâmetros: {}", params)
 
-            # Rate limiting respeitoso
-            time.sleep(self.request_delay)
+            headers = self._conditional_headers(endpoint, params) if cache else None
+            response = self._get(url, params, headers=headers)
+        except httpx.HTTPError as e:
+            logger.error(f"Erro na requisição para {url}: {e}")
+            return None
 
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status() # Raise exception para status HTTPS de erro
+        return self._decode_body(url, endpoint, params, response, cache)
 
-            logger.success(f"Requisição bem-sucessida - Status: {response.status_code}")
-            return response.json()
-        
-        except requests.exceptions.RequestException as e:
+    def _stream_request(self, endpoint: str, params: Optional[Dict] = None, limit: int = 5) -> Optional[_PageCollector]:
+        """
+        Faz uma requisição a um endpoint paginado lendo a resposta em streaming
+
+        Só os primeiros `limit` itens de `data` são materializados; o resto
+        da página nem chega a ser parseado.
+
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros da query string
+            limit: Número de itens de `data` para coletar
+
+        Returns:
+            _PageCollector com cabeçalho e itens ou None em caso de erro
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            logger.debug("Fazendo requisição (streaming) para: {}", url)
+            if params:
+                logger.debug("Parâmetros: {}", params)
+
+            collector = _PageCollector(limit)
+            response = self._get(url, params, stream=True)
+            try:
+                response.raise_for_status()
+                logger.debug("Requisição bem-sucessida - Status: {}", response.status_code)
+
+                # iter_bytes já entrega o corpo descomprimido (brotli/gzip)
+                for chunk in response.iter_bytes():
+                    if collector.feed_bytes(chunk):
+                        break
+                else:
+                    collector.close()
+            finally:
+                response.close()
+
+            return collector
+
+        except httpx.HTTPError as e:
             logger.error(f"Erro na requisição para {url}: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except ijson.JSONError as e:
+            logger.error(f"Erro ao decodificar JSON de {url}: {e}")
+            return None
+
+    async def _get_async(self, client: httpx.AsyncClient, url: str, params: Optional[Dict] = None,
+                         stream: bool = False, headers: Optional[Dict] = None) -> httpx.Response:
+        """
+        Envia um GET respeitando o rate limit e repetindo em caso de HTTP 429
+
+        Args:
+            client: Cliente assíncrono compartilhado
+            url: URL completa
+            params: Parâmetros da query string
+            stream: Se True, o corpo não é lido (o chamador deve fechar a resposta)
+            headers: Headers extras da requisição
+
+        Returns:
+            Resposta final (pode ter status de erro)
+        """
+        for attempt in range(self.max_retries + 1):
+            delay = self._limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+
+            request = client.build_request("GET", url, params=params, headers=headers)
+            response = await client.send(request, stream=stream)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+
+            await response.aclose()
+            delay = _retry_delay(response, attempt)
+            logger.warning(f"HTTP 429 em {url}, nova tentativa em {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def _make_request_async(self, client: httpx.AsyncClient, endpoint: str,
+                                  params: Optional[Dict] = None, cache: bool = False,
+                                  semaphore: Optional[asyncio.Semaphore] = None) -> Optional[Dict]:
+        """
+        Versão assíncrona do _make_request
+
+        Args:
+            client: Cliente assíncrono compartilhado
+            endpoint: Endpoint da API
+            params: Parâmetros da query string
+            cache: Se True, revalida a resposta em cache com GET condicional
+            semaphore: Limite de requisições em voo da execução (opcional)
+
+        Returns:
+            Dicionário com resposta JSON ou None em caso de erro
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            logger.debug("Fazendo requisição para: {}", url)
+            if params:
+                logger.debug("Parâmetros: {}", params)
+
+            headers = self._conditional_headers(endpoint, params) if cache else None
+            async with semaphore or contextlib.nullcontext():
+                response = await self._get_async(client, url, params, headers=headers)
+        except httpx.HTTPError as e:
+            logger.error(f"Erro na requisição para {url}: {e}")
+            return None
+
+        return self._decode_body(url, endpoint, params, response, cache)
+
+    async def _stream_request_async(self, client: httpx.AsyncClient, endpoint: str,
+                                    params: Optional[Dict] = None, limit: int = 5,
+                                    semaphore: Optional[asyncio.Semaphore] = None) -> Optional[_PageCollector]:
+        """
+        Versão assíncrona do _stream_request
+
+        Args:
+            client: Cliente assíncrono compartilhado
+            endpoint: Endpoint da API
+            params: Parâmetros da query string
+            limit: Número de itens de `data` para coletar
+            semaphore: Limite de requisições em voo da execução (opcional)
+
+        Returns:
+            _PageCollector com cabeçalho e itens ou None em caso de erro
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            logger.debug("Fazendo requisição (streaming) para: {}", url)
+            if params:
+                logger.debug("Parâmetros: {}", params)
+
+            collector = _PageCollector(limit)
+            async with semaphore or contextlib.nullcontext():
+                response = await self._get_async(client, url, params, stream=True)
+                try:
+                    response.raise_for_status()
+                    logger.debug("Requisição bem-sucessida - Status: {}", response.status_code)
+
+                    async for chunk in response.aiter_bytes():
+                        if collector.feed_bytes(chunk):
+                            break
+                    else:
+                        collector.close()
+                finally:
+                    await response.aclose()
+
+            return collector
+
+        except httpx.HTTPError as e:
+            logger.error(f"Erro na requisição para {url}: {e}")
+            return None
+        except ijson.JSONError as e:
             logger.error(f"Erro ao decodificar JSON de {url}: {e}")
             return None
         
@@ -91,22 +583,55 @@ class ScryfallExplorer:
         """
         logger.info("Explorando endpoint /sets")
 
-        sets_data = self._make_request("/sets")
+        sets_data = self._make_request("/sets", cache=True)
         if not sets_data:
             return {"error": "Falha ao obter dados dos sets"}
-        
+
+        return self._analyze_sets(sets_data, limit)
+
+    async def explore_sets_async(self, client: httpx.AsyncClient, limit: int = 5,
+                                 semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """
+        Versão assíncrona do explore_sets
+
+        Args:
+            client: Cliente assíncrono compartilhado
+            limit: Número de sets para analisar em detalhes
+            semaphore: Limite de requisições em voo da execução (opcional)
+
+        Returns:
+            Dicionário com análise dos sets
+        """
+        logger.info("Explorando endpoint /sets")
+
+        sets_data = await self._make_request_async(client, "/sets", cache=True, semaphore=semaphore)
+        if not sets_data:
+            return {"error": "Falha ao obter dados dos sets"}
+
+        return self._analyze_sets(sets_data, limit)
+
+    def _analyze_sets(self, sets_data: Dict[str, Any], limit: int) -> Dict[str, Any]:
+        """
+        Monta a análise a partir da resposta do endpoint /sets
+
+        Args:
+            sets_data: Resposta JSON do /sets
+            limit: Número de sets para analisar em detalhes
+
+        Returns:
+            Dicionário com análise dos sets
+        """
         # Analisar primeiros sets em detalhes
         analysis = {
             "total_sets": len(sets_data.get('data', [])),
             #"total_sets_analysed": len(set_data.get())
             "structure_keys": list(sets_data.keys()),
-            "sample_sets": [],
-            "set_types": set(),
-            "date_range": {"oldest": None, "newest": None}
+            "sample_sets": []
         }
+        sample = sets_data.get('data', [])[:limit]
 
         # Analisar primeiros sets em detalhes
-        for i, set_data in enumerate(sets_data.get('data', [])[:limit]):
+        for i, set_data in enumerate(sample):
             set_info = {
                 "object": set_data.get('object'),
                 "code": set_data.get('code'),
@@ -114,20 +639,18 @@ class ScryfallExplorer:
                 "set_type": set_data.get('set_type'),
                 "card_count":set_data.get('card_count'),
                 "released_at": set_data.get('released_at'),
-                "keys": list(set_data.keys())
+                "keys": list(set_data)
             }
 
             analysis["sample_sets"].append(set_info)
-            analysis["set_types"].add(set_data.get('set_type'))
 
-            # Análise temporal
-            release_date = set_data.get('released_at')
-            if release_date:
-                if not analysis["date_range"]["oldest"] or release_date < analysis["date_range"]["oldest"]:
-                    analysis["date_range"]["oldest"] = release_date
-                if not analysis["date_range"]["newest"] or release_date > analysis["date_range"]["newest"]:
-                    analysis["date_range"]["newest"] = release_date
-        analysis["set_types"] = list(analysis["set_types"])
+        # Agregações a partir dos campos já extraídos em sample_sets
+        samples = analysis["sample_sets"]
+        analysis["set_types"] = list({s["set_type"] for s in samples})
+
+        # Análise temporal (datas ISO comparam corretamente como string)
+        dates = [d for s in samples if (d := s["released_at"])]
+        analysis["date_range"] = {"oldest": min(dates, default=None), "newest": max(dates, default=None)}
 
         logger.info(f"Análise dos sets: {len(analysis["sample_sets"])} sets análisados")
         logger.info(f"Análise completa: {analysis['total_sets']} sets encontrados")
@@ -148,57 +671,115 @@ class ScryfallExplorer:
         logger.info(f"Explorando cartas do set: {set_core}")
 
         params = {"q": f"set:{set_core}", "page": 1}
-        cards_data = self._make_request("/cards/search", params)
+        page = self._stream_request("/cards/search", params, limit)
 
-        if not cards_data:
+        if not page:
             return {"error": f"Falha ao obter cartas do set {set_core}"}
-        
+
+        return self._analyze_cards(page, set_core)
+
+    async def explore_cards_async(self, client: httpx.AsyncClient, set_core: str = "inr",
+                                  limit: int = 5, semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """
+        Versão assíncrona do explore_cards
+
+        Args:
+            client: Cliente assíncrono compartilhado
+            set_code: Código do set para buscar cartas
+            limit: Número de cartas para analisar
+            semaphore: Limite de requisições em voo da execução (opcional)
+
+        Returns:
+            Dicionário com análise das cartas
+        """
+        logger.info(f"Explorando cartas do set: {set_core}")
+
+        params = {"q": f"set:{set_core}", "page": 1}
+        page = await self._stream_request_async(client, "/cards/search", params, limit, semaphore=semaphore)
+
+        if not page:
+            return {"error": f"Falha ao obter cartas do set {set_core}"}
+
+        return self._analyze_cards(page, set_core)
+
+    def _analyze_cards(self, page: _PageCollector, set_core: str) -> Dict[str, Any]:
+        """
+        Monta a análise a partir da página de /cards/search
+
+        A leitura em streaming para após as cartas coletadas, então
+        structure_keys lista só as chaves do topo vistas até `data`;
+        chaves posteriores (como `warnings`) não aparecem.
+
+        Args:
+            page: Cabeçalho e cartas coletados da resposta
+            set_code: Código do set consultado
+
+        Returns:
+            Dicionário com análise das cartas
+        """
         # Análise estrutural
         analysis = {
-            "total_cards": cards_data.get('total_cards', 0),
-            "has_more": cards_data.get('has_more', False),
-            "structure_keys": list(cards_data.keys()),
-            "sample_cards": [],
-            "card_types": set(),
-            "colors": set(),
-            "rarities": set(),
-            "languages": set()
+            "total_cards": page.header.get('total_cards') or 0,
+            "has_more": page.header.get('has_more') or False,
+            "structure_keys": list(page.header.keys()),
+            "sample_cards": []
         }
+        cards = page.items
 
         # Analisar cartas em detalhes
-        for i, card in enumerate(cards_data.get('data', [])[:limit]):
-            card_info = {
-                "name": card.get("name"),
-                "mana_cost": card.get("mana_cost"),
-                "type_line": card.get("type_line"),
-                "rarity": card.get("rarity"),
-                "colors": card.get("colors", []),
-                "set": card.get("set"),
-                "lang": card.get("lang"),
-                "keys": list(card.keys()),
-                "total_keys": len(card.keys())
-            }
+        for i, card in enumerate(cards):
+            card_info = _extract_card(card)
+            keys = tuple(card)
+            card_info["keys"] = list(keys)
+            card_info["total_keys"] = len(keys)
 
             analysis["sample_cards"].append(card_info)
 
-            # Agregações para análise
-            if card.get('type_line'):
-                analysis["card_types"].add(card.get('type_line').split('-')[0].strip())
-            if card.get('rarity'):
-                analysis["rarities"].add(card.get('rarity'))
-            if card.get('colors'):
-                analysis["colors"].update(card.get('colors'))
-            if card.get('lang'):
-                analysis["languages"].add(card.get('lang'))
-
-        # Converter sets para listas
-        analysis["card_types"] = list(analysis["card_types"])
-        analysis["colors"] = list(analysis["colors"])
-        analysis["rarities"] = list(analysis["rarities"])
-        analysis["languages"] = list(analysis["languages"])
+        # Agregações para análise, a partir dos campos já extraídos em sample_cards
+        samples = analysis["sample_cards"]
+        analysis["card_types"] = list({_TYPE_SEP.split(t, 1)[0].strip() for c in samples if (t := c["type_line"])})
+        analysis["colors"] = list({color for c in samples for color in c["colors"] or []})
+        analysis["rarities"] = list({r for c in samples if (r := c["rarity"])})
+        analysis["languages"] = list({l for c in samples if (l := c["lang"])})
 
         logger.info(f"Análise completa: {analysis['total_cards']} cartas no set {set_core}")
         return analysis
+
+    async def explore_sets_and_cards_async(self, sets_limit: int = 20, set_codes: Optional[List[str]] = None,
+                                           cards_limit: int = 5) -> Dict[str, Any]:
+        """
+        Explora /sets e as cartas de vários sets em paralelo
+
+        As requisições compartilham um único AsyncClient HTTP/2 e ficam
+        limitadas pelo semáforo e pela janela de 10 requisições por segundo
+
+        Args:
+            sets_limit: Número de sets para analisar em detalhes
+            set_codes: Códigos dos sets para buscar cartas
+            cards_limit: Número de cartas para analisar por set
+
+        Returns:
+            Dicionário com a análise dos sets e das cartas por set
+        """
+        set_codes = set_codes or ["inr"]
+        # Um semáforo por execução: primitivas asyncio ficam presas ao loop em que esperam
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            timeout=30,
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=4)
+        ) as client:
+            sets_analysis, *cards_analyses = await asyncio.gather(
+                self.explore_sets_async(client, sets_limit, semaphore),
+                *(self.explore_cards_async(client, code, cards_limit, semaphore) for code in set_codes)
+            )
+
+        return {
+            "sets": sets_analysis,
+            "cards": dict(zip(set_codes, cards_analyses))
+        }
     
 #    def explore_catalog(self, catalog_type: str = "card-names") -> Dict[str, Any]:
 #        """
@@ -236,14 +817,18 @@ class ScryfallExplorer:
             results: Dados para salvar
             filename: Nome do arquivo
         """
-        # Criar diretório se não exister
-        Path("data/exploration").mkdir(parents=True, exist_ok=True)
-
-        filepath = f"data/exploration/{filename}"
+        filepath = self._out_dir / filename
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            # orjson já gera UTF-8; os bytes vão direto ao descritor, sem TextIOWrapper
+            payload = memoryview(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while payload:
+                    written = os.write(fd, payload)
+                    payload = payload[written:]
+            finally:
+                os.close(fd)
 
             logger.success(f"Resultados salvos em: {filepath}")
         except Exception as e:
@@ -253,19 +838,22 @@ def main():
     """Função principal para exploração da API"""
     logger.info("Iniciando exploração da API Scryfall")
 
-    # Criar diretório de logs
-    Path("logs").mkdir(exist_ok=True)
-
     explorer = ScryfallExplorer()
 
     # Exploraçóo estruturada
-    print("Explorando Sets...")
-    sets_analysis = explorer.explore_sets(limit=20)
-    explorer.save_exploration_results(sets_analysis, "sets_analysis.json")
+    # /sets e /cards/search em paralelo: o parse de uma resposta sobrepõe a outra em voo
+    print("Explorando Sets e Cartas...")
+    results = asyncio.run(
+        explorer.explore_sets_and_cards_async(sets_limit=20, set_codes=["inr"], cards_limit=5)
+    )
+    sets_analysis = results["sets"]
+    cards_analysis = results["cards"]["inr"]
 
-    print("Explorando Cartas...")
-    cards_analysis = explorer.explore_cards(set_core="inr", limit=5)
+    explorer.save_exploration_results(sets_analysis, "sets_analysis.json")
     print(cards_analysis)
+
+    # Esvazia a fila do sink assíncrono antes de encerrar
+    logger.complete()
 #    explorer.save_exploration_results(cards_analysis, "cards_analysis.json")
 #
 #    print("Explorando Catálogos...")
@@ -293,4 +881,10 @@ def main():
 #    logger.info("Exploração da API Scryfall concluída")
 #
 if __name__ == "__main__":
+    # Só na execução como script: troca o handler padrão do loguru (stderr em
+    # DEBUG) por um em INFO, sem mexer em sinks de quem importa o módulo
+    with contextlib.suppress(ValueError):
+        logger.remove(0)
+    logger.add(sys.stderr, level="INFO")
+
     main()
\ No newline at end of file
@@ -7,54 +7,73 @@ Script para verificar se o ambiente está configurado corretamente
 Autor: Leonardo - Engenheiro de Dados
 """
 
+import os
 import sys
+import importlib.util
 import platform
 import subprocess
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 
+@lru_cache
+def _sys_tuple():
+    """Sistema, release e arquitetura (consultados uma única vez)"""
+    return (platform.system(), platform.release(), platform.machine())
+
 def check_python_version():
     """Verifica versão do Python"""
     version = sys.version_info
-    print(f"Python {version.major}.{version.minor}.{version.micro}")
+    lines = [f"Python {version.major}.{version.minor}.{version.micro}"]
 
     if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print("Python 3.8+ é requirido!")
-        return False
+        lines.append("Python 3.8+ é requirido!")
+        return False, lines
     else:
-        print("Versão Python OK")
-        return True
+        lines.append("Versão Python OK")
+        return True, lines
     
 def check_system_info():
     """Informações do sistem"""
-    print(f"Sistema: {platform.system()} {platform.release()}")
-    print(f"Arquitetura: {platform.machine()}")
-    print(f"Diretório atual: {Path.cwd()}")
+    system, release, machine = _sys_tuple()
+    return [
+        f"Sistema: {system} {release}",
+        f"Arquitetura: {machine}",
+        f"Diretório atual: {Path.cwd()}"
+    ]
 
 def check_poetry():
     """Verifica se Poetry está instalado"""
+    # Com o Poetry no mesmo ambiente, os metadados evitam abrir um subprocesso
+    try:
+        return True, [f"Poetry {metadata.version('poetry')}", "Poetry instado corretamente"]
+    except metadata.PackageNotFoundError:
+        pass
+
     try:
         result = subprocess.run(['poetry', '--version'], capture_output=True, text=True)
         
         if result.returncode == 0:
-            print(f"{result.stdout.strip()}")
-            print("Poetry instado corretamente")
-            return True
+            return True, [f"{result.stdout.strip()}", "Poetry instado corretamente"]
         else:
-            print("Poetry não encontrado no PATH")
+            return False, ["Poetry não encontrado no PATH"]
     except FileNotFoundError:
-        print("Poetry não encontrado no PATH")
-        return False
+        return False, ["Poetry não encontrado no PATH"]
     
 def check_dependencies():
     """Verifica dependências instaladas"""
     dependencies = ['requests', 'pandas', 'dotenv', 'loguru']
+    ok = True
+    lines = []
 
+    # find_spec só localiza o módulo, sem executar o código de importação
     for dep in dependencies:
-        try:
-            __import__(dep)
-            print(f"{dep} instalado")
-        except ImportError:
-            print(f"{dep} não instalado")
+        if importlib.util.find_spec(dep) is not None:
+            lines.append(f"{dep} instalado")
+        else:
+            lines.append(f"{dep} não instalado")
+            ok = False
+    return ok, lines
 
 def check_project_structure():
     """Verifica etrutura do projeto"""
@@ -64,57 +83,71 @@ def check_project_structure():
         'docs', 'scripts'
     ]
 
-    print("\n Estrutura do projeto:")
+    # Uma única listagem do diretório em vez de um stat por pasta
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries if entry.is_dir()}
+
+    lines = ["\n Estrutura do projeto:"]
     for dir_name in required_dirs:
-        dir_path = Path(dir_name)
-        if dir_path.exists():
-            print(f"{dir_name}/")
+        if dir_name in present:
+            lines.append(f"{dir_name}/")
         else:
-            print(f"{dir_name}/ (não encontrado)")
+            lines.append(f"{dir_name}/ (não encontrado)")
+    return lines
 
 def test_api_connection():
     """Testa conexão com API Scryfall"""
 
     try:
         import requests
-        response = requests.get('https://api.scryfall.com/sets', timeout=10)
+        # HEAD basta para checar conectividade, sem baixar a lista de sets
+        response = requests.head('https://api.scryfall.com/sets', timeout=10, allow_redirects=True)
 
         if response.status_code == 200:
-            print("Conexão com API Scrufall OK")
-            print(f"Status: {response.status_code}")
-            return True
+            return True, ["Conexão com API Scrufall OK", f"Status: {response.status_code}"]
         else:
-            print(f"API retornou status {response.status_code}")
-            return False
+            return False, [f"API retornou status {response.status_code}"]
     except Exception as e:
-        print(f"Erro na conexão: {e}")
-        return False
+        return False, [f"Erro na conexão: {e}"]
     
+def _flush(out):
+    """Escreve as linhas acumuladas de uma vez e esvazia o buffer"""
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    out.clear()
+
 def main():
     """Função principal"""
-    print((" KyberCorax - Teste de Ambiente"))
-    print("=" * 50)
+    # Cada verificação devolve (ok, linhas); a saída é escrita em blocos
+    out = [" KyberCorax - Teste de Ambiente", "=" * 50]
 
     # Verificações básicas
-    print("\n Verificações do Sistema:")
-    check_system_info()
+    out.append("\n Verificações do Sistema:")
+    out += check_system_info()
 
-    print("\n Verificações de Software")
-    python_ok = check_python_version()
-    poetry_ok = check_poetry()
+    out.append("\n Verificações de Software")
+    python_ok, lines = check_python_version()
+    out += lines
+    poetry_ok, lines = check_poetry()
+    out += lines
 
     if python_ok and poetry_ok:
-        print("\n Verificações de Dependências:")
-        check_dependencies()
-
-        print("\n Teste de Conectividade:")
-        test_api_connection()
-
-    check_project_structure()
-
-    print("\n" + "=" * 50)
-    print("Teste completo!")
-    print("Se houver erro,  resolva antes de continuar")
+        out.append("\n Verificações de Dependências:")
+        _, lines = check_dependencies()
+        out += lines
+
+        # Mostra o que já foi verificado antes do teste de rede (até 10s)
+        out.append("\n Teste de Conectividade:")
+        _flush(out)
+        _, lines = test_api_connection()
+        out += lines
+
+    out += check_project_structure()
+
+    out.append("\n" + "=" * 50)
+    out.append("Teste completo!")
+    out.append("Se houver erro,  resolva antes de continuar")
+    _flush(out)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file